@@ -17,4 +17,4 @@ print(json.dumps({
     WindTurbine.T_SHAPE.value: get_default_parameters(WindTurbine.T_SHAPE),
     WindTurbine.H_SHAPE.value: get_default_parameters(WindTurbine.H_SHAPE),
     WindTurbine.STAR_SHAPE.value: get_default_parameters(WindTurbine.STAR_SHAPE)
-}, indent=2))
+}))
@@ -1,15 +1,17 @@
 const { exec } = require('child_process');
+const crypto = require('crypto');
 const path = require('path');
 const fs = require('fs');
 const express = require('express');
 require('dotenv').config();
 
 const app = express();
-app.use(express.json());
+app.disable('x-powered-by');
 
 const rootPath = path.join(__dirname, '..');
+const publicPath = path.join(rootPath, 'public');
 
-app.use(express.static(path.join(rootPath, 'public')));
+app.use(express.static(publicPath));
 
 app.use('/openafpm-cad-visualization.js', (req, res) => {
     res.sendFile(path.join(rootPath, 'node_modules', 'openafpm-cad-visualization', 'public', 'openafpm-cad-visualization.js'))
@@ -17,34 +19,169 @@ app.use('/openafpm-cad-visualization.js', (req, res) => {
 
 app.use('/defaultparameters', (req, res) => {
     getDefaultParameters().then(defaultParameters => {
-        res.status(200).send(JSON.parse(defaultParameters));
+        res.status(200).type('json').send(defaultParameters);
     }).catch(err => {
         console.error(err);
         res.status(500).send({ error: err.toString() });
     });
 });
 
-app.use('/visualize', (req, res) => {
-    const json = JSON.stringify(req.body);
-    const filepath = path.join(__dirname, 'parameters.json');
-    fs.writeFileSync(filepath, json);
-    const filename = 'wind-turbine.obj';
-    const objFilepath = path.join(__dirname, '..', 'public', filename);
-    visualize(objFilepath).then((stdout) => {
+// The request body is validated here and then forwarded byte-for-byte
+// to visualize.py instead of being re-serialized.
+app.use('/visualize', express.raw({ type: 'application/json' }), (req, res) => {
+    if (!Buffer.isBuffer(req.body) || !isJsonObject(req.body)) {
+        res.status(400).send({ error: 'Expected a JSON request body.' });
+        return;
+    }
+    const key = hashParameters(req.body);
+    const directory = path.join(visualizationsPath, key);
+    const urlPath = `${visualizationsUrlPath}/${key}`;
+    visualize(key, req.body, directory).then((stdout) => {
         console.log(stdout);
-        res.status(200).send({ objUrl: filename });
+        res.status(200).send({
+            objUrl: `${urlPath}/${objFilename}`,
+            archiveUrl: `${urlPath}/${archiveFilename}`
+        });
     }).catch(err => {
         console.error(err);
         res.status(500).send({ error: err.toString() });
     });
 });
 
-function visualize(filepath) {
-    return execPythonScript('visualize', filepath);
+const visualizationsUrlPath = 'visualizations';
+const visualizationsPath = path.join(publicPath, visualizationsUrlPath);
+const objFilename = 'wind-turbine.obj';
+// Written by openafpm-cad-core's save_to.
+const archiveFilename = 'WindTurbine.zip';
+
+const visualizationsInProgress = new Map();
+
+function visualize(key, parameters, directory) {
+    const cachedVisualization = cachedVisualizationsByKey.get(key);
+    if (cachedVisualization) {
+        cacheVisualization(key, cachedVisualization);
+        return Promise.resolve(`${directory} found in cache.`);
+    }
+    // Identical requests arriving while a visualization is still running
+    // share its result instead of starting FreeCAD again.
+    let visualization = visualizationsInProgress.get(key);
+    if (!visualization) {
+        visualization = createVisualization(key, parameters, directory).then(stdout => {
+            return getDirectorySize(directory).catch(err => {
+                // The run succeeded, so still cache it and let it age out of the LRU.
+                console.error(err);
+                return 0;
+            }).then(size => {
+                cacheVisualization(key, { directory, size });
+                return stdout;
+            });
+        }).finally(() => {
+            visualizationsInProgress.delete(key);
+        });
+        visualizationsInProgress.set(key, visualization);
+    }
+    return visualization;
+}
+
+function createVisualization(key, parameters, directory) {
+    // Requests with different parameters get their own input file and
+    // output directory so they can run side by side without overwriting
+    // each other's OBJ file or archive.
+    const parametersFilepath = path.join(__dirname, `parameters-${key}.json`);
+    // Wait for an eviction of this key still in progress,
+    // so it can't delete the directory out from under this run.
+    const pendingRemoval = pendingRemovalsByKey.get(key) || Promise.resolve();
+    return pendingRemoval.then(() => {
+        return fs.promises.mkdir(directory, { recursive: true });
+    }).then(() => {
+        return fs.promises.writeFile(parametersFilepath, parameters);
+    }).then(() => {
+        return execPythonScript('visualize', parametersFilepath, directory);
+    }).catch(err => {
+        // Don't leave partial output from a failed run behind.
+        return fs.promises.rm(directory, { recursive: true, force: true }).then(() => {
+            throw err;
+        });
+    }).finally(() => {
+        return fs.promises.unlink(parametersFilepath).catch(err => console.error(err));
+    });
 }
 
+const maxCachedBytes = 512 * 1024 * 1024;
+// Ordered from least to most recently used.
+// Kept in memory only, so after a restart visualizations are recomputed
+// and pick up changes to openafpm-cad-core.
+const cachedVisualizationsByKey = new Map();
+let cachedBytes = 0;
+const pendingRemovalsByKey = new Map();
+
+function cacheVisualization(key, visualization) {
+    if (cachedVisualizationsByKey.delete(key)) {
+        cachedBytes -= visualization.size;
+    }
+    cachedVisualizationsByKey.set(key, visualization);
+    cachedBytes += visualization.size;
+    // Always keep the visualization just requested, even if it alone exceeds the budget.
+    while (cachedBytes > maxCachedBytes && cachedVisualizationsByKey.size > 1) {
+        const [leastRecentlyUsedKey, leastRecentlyUsed] = cachedVisualizationsByKey.entries().next().value;
+        cachedVisualizationsByKey.delete(leastRecentlyUsedKey);
+        cachedBytes -= leastRecentlyUsed.size;
+        removeDirectory(leastRecentlyUsedKey, leastRecentlyUsed.directory);
+    }
+}
+
+function removeDirectory(key, directory) {
+    const removal = fs.promises.rm(directory, { recursive: true, force: true }).catch(err => {
+        console.error(err);
+    }).finally(() => {
+        if (pendingRemovalsByKey.get(key) === removal) {
+            pendingRemovalsByKey.delete(key);
+        }
+    });
+    pendingRemovalsByKey.set(key, removal);
+}
+
+function getDirectorySize(directory) {
+    return fs.promises.readdir(directory, { withFileTypes: true }).then(entries => {
+        return Promise.all(entries.map(entry => {
+            const entryPath = path.join(directory, entry.name);
+            if (entry.isDirectory()) {
+                return getDirectorySize(entryPath);
+            }
+            return fs.promises.stat(entryPath).then(stats => stats.size);
+        }));
+    }).then(sizes => sizes.reduce((total, size) => total + size, 0));
+}
+
+function isJsonObject(buffer) {
+    try {
+        const value = JSON.parse(buffer);
+        return value !== null && typeof value === 'object' && !Array.isArray(value);
+    } catch (err) {
+        return false;
+    }
+}
+
+function hashParameters(parameters) {
+    return crypto.createHash('sha1').update(parameters).digest('hex');
+}
+
+let defaultParametersPromise = null;
+
 function getDefaultParameters() {
-    return execPythonScript('get_default_parameters');
+    // Default parameters never change at runtime, so only pay for
+    // starting FreeCAD once and reuse the result for later requests.
+    if (!defaultParametersPromise) {
+        defaultParametersPromise = execPythonScript('get_default_parameters').then(stdout => {
+            // Validate once before caching so stray output is never served as JSON.
+            JSON.parse(stdout);
+            return stdout;
+        }).catch(err => {
+            defaultParametersPromise = null;
+            throw err;
+        });
+    }
+    return defaultParametersPromise;
 }
 
 function execPythonScript(scriptName, ...args) {
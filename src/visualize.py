@@ -1,6 +1,6 @@
 """
 Usage:
-    python visualize.py <obj filepath>
+    python visualize.py <parameters filepath> <output directory>
 
 FREECAD_LIB environment variable must be set.
 """
@@ -11,7 +11,8 @@ import FreeCAD
 from openafpm_cad_core.app import visualize
 import json
 
-with open('parameters.json') as f:
+parameters_filepath = sys.argv[1]
+with open(parameters_filepath) as f:
     parameters = json.loads(f.read())
 
 magnafpm_parameters = parameters['magnafpm']
@@ -22,10 +23,10 @@ wind_turbine = visualize(magnafpm_parameters, user_parameters, furling_parameter
 
 obj_file_contents = wind_turbine.to_obj()
 
-filepath = sys.argv[1]
+output_directory = sys.argv[2]
+filepath = os.path.join(output_directory, 'wind-turbine.obj')
 with open(filepath, 'w') as f:
     f.write(obj_file_contents)
     print(filepath + ' created.')
 
-path = os.path.dirname(filepath)
-wind_turbine.save_to(path)
+wind_turbine.save_to(output_directory)